@@ -1,7 +1,7 @@
 """Simulations for (real) time evolution."""
 # Copyright (C) TeNPy Developers, GNU GPLv3
 
-import numpy as np
+import logging
 
 from . import simulation
 from .simulation import *
@@ -43,11 +43,11 @@ class RealTimeEvolution(Simulation):
         Calls ``self.engine.run()`` and :meth:`make_measurements`.
         """
         # TODO: more fine-grained/custom break criteria?
-        while True:
-            if np.real(self.engine.evolved_time) >= self.final_time:
-                break
-            self.logger.info("evolve to time %.2f, max chi=%d", self.engine.evolved_time.real,
-                             max(self.psi.chi))
+        while self.engine.evolved_time.real < self.final_time:
+            if self.logger.isEnabledFor(logging.INFO):
+                # only compute `max(psi.chi)` if the message is actually emitted
+                self.logger.info("evolve to time %.2f, max chi=%d", self.engine.evolved_time.real,
+                                 max(self.psi.chi))
             self.engine.run()
             # for time-dependent H (TimeDependentExpMPOEvolution) the engine can re-init the model;
             # use it for the measurements....
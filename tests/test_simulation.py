@@ -242,6 +242,9 @@ def test_RealTimeEvolution():
     assert np.allclose(meas['evolved_time'], expected_times)
     assert np.all(meas['measurement_index'] == np.arange(N))
     assert np.all(meas['dummy_value'] == [-1] + [expected_dummy_value] * (N - 1))
+    # final_time already reached: running again should neither evolve nor measure
+    sim.run_algorithm()
+    assert len(sim.results['measurements']['measurement_index']) == N
 
 
 def test_output_filename_from_dict():